@@ -15,6 +15,7 @@ import traceback
 import requests
 
 from flask import Flask
+from flask import make_response
 from flask import render_template
 from flask import redirect
 from flask import request
@@ -294,7 +295,7 @@ def load():
         when, response = load_cache[url]
         if time.time() - when < 60:
             print("/load: network cache hit:", url)
-            return response
+            return conditional_response(response)
     headers = {
         "Authorization": request.headers.get("Authorization")
     }
@@ -312,7 +313,19 @@ def load():
         pass
     load_cache[url] = time.time(), response
     print("/load: network cache miss", url, type(response), len(response), response[:128])
-    return response # send regular string
+    return conditional_response(response) # send regular string
+
+
+def conditional_response(content):
+    """
+    Wraps the content in a response with an ETag, answering with a 304 when
+    the client already has the same content cached.
+    """
+    response = make_response(content)
+    if request.method == "GET":
+        response.add_etag()
+        response.make_conditional(request)
+    return response
 
 
 @app.route("/version", methods=["GET"])
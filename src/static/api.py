@@ -17,6 +17,7 @@ import polyscript # type: ignore    pylint: disable=import-error
 
 
 cache = functools.cache if hasattr(functools, "cache") else lambda func: func
+lru_cache = functools.lru_cache if hasattr(functools, "lru_cache") else lambda maxsize: lambda func: func
 
 @cache
 def get_col_row_from_key(key: str):
@@ -32,10 +33,11 @@ def get_col_row_from_key(key: str):
     row = 0
     col = 0
     for c in key:
-        if c.isdigit():
-            row = row * 10 + int(c)
+        code = ord(c)
+        if code < 58: # ord("9") + 1
+            row = row * 10 + code - 48 # ord("0")
         else:
-            col = col * 26 + ord(c) - ord("A") + 1
+            col = col * 26 + code - 64 # ord("A") - 1
     return col, row
 
 
@@ -50,11 +52,16 @@ def get_column_name(col: int):
     Returns:
         str: The column name corresponding to the input column index.
     """
-    parts = []
+    name = bytearray(7) # "ZZZZZZZ" is column 8,353,082,582
+    n = 7
     while col > 0:
         col, remainder = divmod(col - 1, 26)
-        parts.insert(0, chr(remainder + ord("A")))
-    return "".join(parts)
+        n -= 1
+        name[n] = remainder + 65 # ord("A")
+    return name[n:].decode("ascii")
+
+
+_COLUMN_NAMES = [get_column_name(col) for col in range(1024)] # "" for index 0, then "A" to "AMI"
 
 
 @cache
@@ -69,7 +76,8 @@ def get_key_from_col_row(col: int, row: int):
     Returns:
         str: The cell reference key (e.g. "A1", "BC45") corresponding to the input column and row indices.
     """
-    return f"{get_column_name(col)}{row}"
+    name = _COLUMN_NAMES[col] if 0 <= col < len(_COLUMN_NAMES) else get_column_name(col)
+    return f"{name}{row}"
 
 
 cell_reference = re.compile("^[A-Z]+[0-9]+$")
@@ -80,6 +88,9 @@ def convert(value: str):
     """
     Attempts to convert the given `value` to a float if it contains a decimal point, otherwise to an integer.
     If the conversion fails, returns the original `value` if it is truthy, otherwise 0.
+
+    Plain decimal strings are recognized in a single scan and cast directly. Anything else,
+    such as text, exponents, underscores, or non-ASCII digits, is cast with `float()` or `int()`.
     
     Args:
         value (str): The value to be converted.
@@ -87,6 +98,20 @@ def convert(value: str):
     Returns:
         Union[float, int, str]: The converted value, or the original value if conversion fails.
     """
+    if isinstance(value, str):
+        text = value.strip()
+        seen_dot = False
+        seen_digit = False
+        for c in text[1:] if text[:1] in ("+", "-") else text:
+            if "0" <= c <= "9":
+                seen_digit = True
+            elif c == "." and not seen_dot:
+                seen_dot = True
+            else:
+                break
+        else:
+            if seen_digit:
+                return float(text) if seen_dot else int(text)
     try:
         return float(value) if isinstance(value, str) and "." in value else int(value)
     except ValueError:
@@ -103,13 +128,30 @@ def rgb_to_hex(rgb):
     Returns:
         str: The hexadecimal color string in the format "#RRGGBB".
     """
+    if not rgb.startswith("rgb(") or not rgb.endswith(")"):
+        return "#FF3333"
     try:
-        r, g, b = map(int, rgb[4:-1].split(", "))
+        r, g, b = map(int, rgb[4:-1].split(","))
         return f"#{r:02x}{g:02x}{b:02x}"
     except ValueError:
         return "#FF3333"
 
 
+def _scan_cell_reference(s: str, start: int, end: int):
+    """
+    Checks if `s[start:end]` is one or more uppercase letters followed by one or more digits.
+    This avoids running the regex engine (and allocating a Match object) for every check.
+    """
+    n = start
+    while n < end and "A" <= s[n] <= "Z":
+        n += 1
+    if n in (start, end):
+        return False
+    while n < end and "0" <= s[n] <= "9":
+        n += 1
+    return n == end
+
+
 def is_cell_reference(s: str):
     """
     Checks if the given string `s` is a valid cell reference.
@@ -124,9 +166,9 @@ def is_cell_reference(s: str):
     """
     length = len(s)
     n = 0
-    while n < length and s[n] >= 'A' and s[n] <= 'Z':
+    while n < length and "A" <= s[n] <= "Z":
         n += 1
-    while n < length and s[n] >= '0' and s[n] <= '9':
+    while n < length and "0" <= s[n] <= "9":
         n += 1
     return n == length
 
@@ -144,64 +186,74 @@ def is_cell_range_reference(s: str):
     Returns:
         bool: True if `s` is a valid cell range reference, False otherwise.
     """
-    return isinstance(s, str) and re.match(cell_range_reference, s)
+    if not isinstance(s, str):
+        return False
+    colon = s.find(":")
+    if colon == -1:
+        return False
+    start_end = colon
+    while start_end > 0 and s[start_end - 1] == " ":
+        start_end -= 1
+    end_start = colon + 1
+    length = len(s)
+    if length and s[length - 1] == "\n":
+        length -= 1 # like "$" in cell_range_reference, allow one trailing newline
+    while end_start < length and s[end_start] == " ":
+        end_start += 1
+    return _scan_cell_reference(s, 0, start_end) and _scan_cell_reference(s, end_start, length)
 
 
+@lru_cache(maxsize=1024)
+def _parse(script: str):
+    """
+    Parses the given Python script into an abstract syntax tree.
+
+    The worker typically analyzes and then runs the same script, so the tree is
+    shared between `find_inputs` and `intercept_last_expression`. Callers must
+    treat the returned tree as read-only.
+    """
+    import ast # pylint: disable=import-outside-toplevel
+    return ast.parse(script)
+
+
+@lru_cache(maxsize=4096)
 def find_inputs(script: str):
     """
     Finds all the input cell references in the given Python script.
     
-    This function uses the `ast` module to parse the script and visit each node in
+    This function uses the `ast` module to parse the script and walks each node in
     the abstract syntax tree. It identifies any names that represent cell references
     and any constant values that represent cell range references, and adds them to a set of
-    input cell references.
+    input cell references. Results are memoized per script, as the same formulas are
+    analyzed again whenever one of their dependencies changes.
     
     Args:
         script (str): The Python script to analyze.
     
     Returns:
-        list: A list of all the input cell references found in the script.
+        tuple: All the input cell references found in the script.
     """
     import ast # pylint: disable=import-outside-toplevel
 
-    class InputFinder(ast.NodeVisitor):
-        """
-        A class that visits the nodes of a Python script's abstract syntax tree
-        (AST) to find all the input cell references in the script.
-        """
-        inputs = set()
-
-        def __init__(self, script):
-            self.visit(ast.parse(script))
-
-        def add_input(self, s):
-            """ Adds an input key to the set of input keys. """
-            if is_cell_reference(s):
-                self.inputs.add(s)
-
-        def visit_Name(self, node): # pylint: disable=invalid-name
-            """ Visit an ast.Name node """
-            if isinstance(node.ctx, ast.Load):
-                self.add_input(node.id)
-            return node
-
-        def visit_Constant(self, node): # pylint: disable=invalid-name
-            """ Visit an ast.Constant node """
-            if is_cell_range_reference(node.value):
-                start, end = node.value.split(":")
-                start = start.strip()
-                end = end.strip()
-                start_col, start_row = get_col_row_from_key(start)
-                end_col, end_row = get_col_row_from_key(end)
-                for col in range(start_col, end_col + 1):
-                    for row in range(start_row, end_row + 1):
-                        self.add_input(get_key_from_col_row(col, row))
-            return node
-
     try:
-        return list(InputFinder(script).inputs)
+        tree = _parse(script)
     except SyntaxError:
-        return []
+        return ()
+    inputs = set()
+    for node in ast.walk(tree):
+        kind = type(node)
+        if kind is ast.Name:
+            name = node.id # always a str, so scan it directly
+            if isinstance(node.ctx, ast.Load) and _scan_cell_reference(name, 0, len(name)):
+                inputs.add(name)
+        elif kind is ast.Constant and is_cell_range_reference(node.value):
+            start, end = node.value.split(":")
+            start_col, start_row = get_col_row_from_key(start.strip())
+            end_col, end_row = get_col_row_from_key(end.strip())
+            rows = range(start_row, end_row + 1)
+            columns = [get_column_name(col) for col in range(start_col, end_col + 1)]
+            inputs.update(f"{column}{row}" for column in columns for row in rows)
+    return tuple(inputs)
 
 
 def intercept_last_expression(script):
@@ -217,7 +269,7 @@ def intercept_last_expression(script):
     import ast # pylint: disable=import-outside-toplevel
     if not script:
         return ""
-    tree = ast.parse(script)
+    tree = _parse(script)
     last = tree.body[-1]
     lines = script.split("\n")
     if isinstance(last, (ast.Expr, ast.Assign)):
@@ -227,6 +279,14 @@ def intercept_last_expression(script):
     return "\n".join(lines)
 
 
+_JS_PRIMITIVES = (int, float, bool, str, type(None)) # marshalled by PyScript as-is
+_encode_json = (
+    json.JSONEncoder(separators=(",", ":")).encode
+    if hasattr(json, "JSONEncoder")
+    else json.dumps # MicroPython
+)
+
+
 def to_js(python_object):
     """
     Converts a Python object to a JavaScript object.
@@ -236,11 +296,13 @@ def to_js(python_object):
     
     Returns:
         Any: The JavaScript representation of the Python object. If the input is already a
-                JavaScript object, it is returned as-is.
+                JavaScript object or a primitive value, it is returned as-is.
     """
+    if type(python_object) in _JS_PRIMITIVES: # pylint: disable=unidiomatic-typecheck
+        return python_object
     if python_object.__class__.__name__ == "jsobj":
         return python_object
-    return ltk.window.to_js(json.dumps(python_object))
+    return ltk.window.to_js(_encode_json(python_object))
 
 
 def index_to_col(index: int):
@@ -253,12 +315,7 @@ def index_to_col(index: int):
     Returns:
         str: The column letter corresponding to the given index.
     """
-    col = ''
-    index -= 1
-    while index >= 0:
-        col = chr(index % 26 + ord('A')) + col
-        index = index // 26 - 1
-    return col
+    return get_column_name(index)
 
 
 def shorten(s: str, length: int):
@@ -272,7 +329,7 @@ def shorten(s: str, length: int):
     Returns:
         str: The shortened string, with an ellipsis appended if the string was truncated.
     """
-    return f"{s[:length - 3]}{s[length - 3:] and '...'}"
+    return s if len(s) <= length else s[:length - 3] + "..."
 
 
 class PySheets():
@@ -310,18 +367,18 @@ class PySheets():
         except Exception as exc: # pylint: disable=broad-except
             raise ValueError(f"Parameter selection must be a range like 'A1:F14', not {selection}") from exc
 
+        columns = range(start_col, end_col + 1)
+        rows = range(start_row + 1 if headers else start_row, end_row + 1)
+        get = self._inputs.get
         data = {}
-        for col in range(start_col, end_col + 1):
-            keys = [
-                f"{index_to_col(col)}{row}" for row in range(start_row, end_row + 1)
-            ]
-            values = [ self._inputs.get(key, "") for key in keys ]
-            header = values.pop(0) if headers else f"col-{col}"
-            data[header] = values
-        df = pd.DataFrame.from_dict(data)
-        if not isinstance(df, pd.DataFrame):
-            return "Error: Incomplete Data"
-        return df
+        header = []
+        for index, col in enumerate(columns):
+            name = get_column_name(col)
+            header.append(get(f"{name}{start_row}", "") if headers else f"col-{col}")
+            data[index] = [get(f"{name}{row}", "") for row in rows]
+        frame = pd.DataFrame(data)
+        frame.columns = header
+        return frame
 
     def get_cell(self, key:str):
         """
@@ -395,7 +452,7 @@ class PySheets():
         """
         assert isinstance(column, int), f"Parameter column must be an integer, not {type(column)}"
         assert isinstance(row, int), f"Parameter row must be an integer, not {type(row)}"
-        return ltk.window.getKeyFromColumnRow(column, row)
+        return get_key_from_col_row(column, row)
 
     def load_url(self, url:str, handler:callable=None):
         """
@@ -537,13 +594,22 @@ def get_dict_table(result):
     """
     if not isinstance(result, dict):
         raise ValueError(f"Expected a dict, got {type(result)}")
-    return "".join([
-        "<table border='1' class='dict_table'>",
-            "<thead>",
-                "<tr><th>key</th><th>value</th></tr>",
-            "</thead>",
-            "<tbody>",
-                "".join(f"<tr><td>{key}</td><td>{get_dict_table(value)}</td></tr>" for key, value in result.items()),
-            "</thead>",
-        "</table>",
-    ])
+    out = []
+    _write_dict_table(result, out)
+    return "".join(out)
+
+
+def _write_dict_table(result, out):
+    """
+    Appends the HTML for `result` to the list `out`, recursing into nested dictionaries.
+    Values that are not dictionaries are rendered using their `repr`.
+    """
+    if not isinstance(result, dict):
+        out.append(repr(result))
+        return
+    out.append("<table border='1' class='dict_table'><thead><tr><th>key</th><th>value</th></tr></thead><tbody>")
+    for key, value in result.items():
+        out.append(f"<tr><td>{key}</td><td>")
+        _write_dict_table(value, out)
+        out.append("</td></tr>")
+    out.append("</tbody></table>")
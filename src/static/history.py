@@ -64,9 +64,12 @@ def schedule_flush():
 def flush():
     """
     Flushes the changes to the storage and schedules a status update to be displayed after a short delay.
+    A flush that is still scheduled is cancelled, as this call already saves its changes.
     """
     global flush_scheduled
-    flush_scheduled = False
+    if flush_scheduled:
+        ltk.cancel("flush events")
+        flush_scheduled = False
     storage.save(state.SHEET)
     ltk.schedule(show_status, "show status", 0.3)
 
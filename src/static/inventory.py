@@ -4,6 +4,11 @@ Copyright (c) 2024 laffra - All Rights Reserved.
 Retrieves and displays a list of sheets in the application's main view.
 """
 
+try:
+    import html
+except ImportError: # MicroPython has no html module
+    html = None
+
 import constants
 import ltk
 import state
@@ -11,70 +16,81 @@ import menu
 
 import storage
 
+
+PLACEHOLDER_HTML = (
+    '<button class="ltk-button new-button temporary" style="opacity:0">New Sheet</button>' + (
+        '<div class="ltk-card document-card temporary" style="opacity:0">'
+            '<div class="ltk-div" style="width:204px;height:188px"></div>'
+        '</div>'
+    ) * 5
+)
+
+
 def list_sheets():
     """
     Retrieves and displays a list of sheets in the application's main view.
     """
     state.clear()
-    ltk.find("#main").append(
-        ltk.Button("New Sheet", ltk.proxy(lambda event: None)).addClass("new-button temporary"),
-        ltk.Card(ltk.Div().css("width", 204).css("height", 188)).addClass("document-card temporary"),
-        ltk.Card(ltk.Div().css("width", 204).css("height", 188)).addClass("document-card temporary"),
-        ltk.Card(ltk.Div().css("width", 204).css("height", 188)).addClass("document-card temporary"),
-        ltk.Card(ltk.Div().css("width", 204).css("height", 188)).addClass("document-card temporary"),
-        ltk.Card(ltk.Div().css("width", 204).css("height", 188)).addClass("document-card temporary"),
-    )
-    ltk.find(".temporary").css("opacity", 0).animate(ltk.to_js({ "opacity": 1 }), 2000)
+    ltk.find("#main").append(PLACEHOLDER_HTML)
+    ltk.find(".temporary").animate(ltk.to_js({ "opacity": 1 }), 2000)
     storage.list_sheets(show_sheet_list)
     ltk.find("#main").animate(ltk.to_js({ "opacity": 1 }), constants.ANIMATION_DURATION)
     ltk.find("#menu").empty().append(menu.create_menu())
     ltk.find("#title").attr("readonly", "true")
 
 
+def _escape(value):
+    """
+    Escapes a value for use as HTML text or inside a quoted attribute, like `html.escape(value, quote=True)`.
+    """
+    text = str(value)
+    if html:
+        return html.escape(text, quote=True)
+    return (text
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#x27;")
+    )
+
+
 def show_sheet_list(sheets):
     """
     Displays a list of sheets in the application's main view. This function is responsible for creating
     the UI elements that represent each sheet, including a screenshot, name, and a click/keyboard
     event handler to load the sheet.
+
+    All cards are inserted as a single HTML string, and one delegated click and keydown handler
+    on their container loads the sheet whose uid is stored on the card.
     """
     state.clear()
     ltk.find("#main").empty()
 
-    def create_card(uid, index, runtime, *items):
-        def select_doc(event):
-            if event.keyCode == 13:
-                load_sheet(uid, runtime)
-
-        return (
-            ltk.Card(*items)
-                .on("click", ltk.proxy(lambda event=None: load_sheet(uid, runtime)))
-                .on("keydown", ltk.proxy(select_doc))
-                .attr("tabindex", 1000 + index)
-                .addClass("document-card")
-        )
-
-    ltk.find("#main").append(
-        ltk.Container(
-            *[
-                create_card(
-                    sheet.uid,
-                    index,
-                    "mpy",
-                    "",
-                    ltk.VBox(
-                        ltk.Image(sheet.screenshot),
-                        ltk.Text(sheet.name),
-                    ),
-                )
-                for index, sheet in enumerate(sheets)
-                if sheet.uid
-            ]
-        ).prepend(
-            ltk.Button("New Sheet", ltk.proxy(lambda event: menu.new_sheet())).addClass(
-                "new-button"
-            )
-        ).css("overflow", "auto").css("height", "100%")
+    def select_doc(event):
+        load_sheet(event.currentTarget.dataset.uid, "mpy")
+
+    def select_doc_with_key(event):
+        if event.keyCode == 13:
+            select_doc(event)
+
+    cards = "".join(
+        f'<div class="ltk-card document-card" tabindex="{1000 + index}" data-uid="{_escape(sheet.uid)}">'
+            '<div class="ltk-vbox">'
+                f'<img class="ltk-image" src="{_escape(sheet.screenshot or "")}">'
+                f'<div class="ltk-text">{_escape(sheet.name)}</div>'
+            '</div>'
+        '</div>'
+        for index, sheet in enumerate(sheets)
+        if sheet.uid
+    )
+    container = ltk.Container(
+        ltk.Button("New Sheet", ltk.proxy(lambda event: menu.new_sheet())).addClass("new-button")
     )
+    container.element.append(cards)
+    container.on("click", ".document-card", ltk.proxy(select_doc))
+    container.on("keydown", ".document-card", ltk.proxy(select_doc_with_key))
+    ltk.find("#main").append(container.css("overflow", "auto").css("height", "100%"))
     ltk.find(".document-card").eq(0).focus()
     state.show_message("Select a sheet below or create a new one...")
 
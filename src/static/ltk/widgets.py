@@ -1,11 +1,9 @@
 # LTK - Copyright 2023 - All Rights Reserved - chrislaffra.com - See LICENSE 
 
 from pyscript import window # type: ignore
+from pyscript import document # type: ignore
 from ltk.jquery import *
-import itertools
-import json
 import logging
-import math
 
 __all__ = [
     "HBox", "Div", "VBox", "Container", "Card", "Preformatted", "Text", "Input", "Checkbox",
@@ -17,19 +15,41 @@ __all__ = [
     "Option", "Widget", "Form", "FieldSet", "Legend", "Tutorial", "Step", "Canvas",
 ]
 
+GeneratorType = type(child for child in ())  # the types module is not available on MicroPython
 BROWSER_SHORTCUTS = [ "Cmd+N","Cmd+T","Cmd+W", "Cmd+Q" ]
 DEFAULT_CSS = {}
 shortcuts = {}
 timers = {}
+_prototypes = {}
+_js_properties = {}
+_body = window.jQuery(window.document.body)
 
 logger = logging.getLogger("root")
 
+def _css_to_js(properties):
+    """
+    Convert a dict of CSS properties to a JavaScript object, reusing earlier conversions
+    of the same properties and values. Dicts with unhashable values are converted each time.
+    """
+    key = tuple(properties.items())
+    try:
+        js_properties = _js_properties.get(key)
+    except TypeError:
+        return to_js(properties)
+    if js_properties is None:
+        if len(_js_properties) >= 256:
+            _js_properties.clear()
+        js_properties = _js_properties[key] = to_js(properties)
+    return js_properties
+
+
 class Widget(object):
     """Base class for LTK widgets."""
     classes = []
     instances = {}
     element = None
     tag = "div"
+    input_type = None
 
     def __init__(self, *args):
         """
@@ -41,22 +61,55 @@ class Widget(object):
         Sets:
             self.element: The jQuery element representing this widget.
         """
-        self.element = (
-            window.jQuery(f"<{self.tag}>")
-                .addClass(" ".join(self.classes))
-                .append(*self._flatten(args))
-        )
+        self.element = self._create_element()
+        children = self._flatten(args)
+        if children:
+            # jQuery inserts all children through a single document fragment
+            self.element.append(*children)
         self._handle_css(args)
 
+    def _create_element(self):
+        """Create the jQuery element for this widget. See _create_node."""
+        return window.jQuery(self._create_node())
+
+    def _create_node(self):
+        """Create the DOM element for this widget by cloning a prototype DOM element.
+
+        Each widget class gets one prototype with its tag and classes already set, so
+        constructing a widget does not need jQuery to parse an HTML string. Instances that
+        override the tag or classes of their class get a new element instead.
+        For <input> widgets, the prototype also has the input_type already set.
+        """
+        cls = self.__class__
+        if "tag" in self.__dict__ or "classes" in self.__dict__:
+            return self._new_node(self.tag, self.classes, self.input_type)
+        prototype = _prototypes.get(cls)
+        if prototype is None:
+            prototype = _prototypes[cls] = self._new_node(cls.tag, cls.classes, cls.input_type)
+        return prototype.cloneNode(False)
+
+    @staticmethod
+    def _new_node(tag, classes, input_type):
+        node = window.document.createElement(tag)
+        node.className = " ".join(classes)
+        if input_type:
+            node.type = input_type
+        return node
+
     def _handle_css(self, args):
         """Apply CSS styles passed in the args to the widget.
 
         Iterates through the args and checks for any that are dicts, 
         treating them as CSS style definitions to apply to the widget.
+        All styles are merged and sent to jQuery in a single call.
         """
-        for arg in filter(lambda arg: isinstance(arg, dict), args):
-            for key, value in arg.items():
-                self.css(key, value)
+        styles = {}
+        for arg in args:
+            if isinstance(arg, dict):
+                styles.update(arg)
+        if not styles:
+            return
+        self.element.css(_css_to_js(styles))
 
     def _flatten(self, children):
         """Flatten a list of child widgets into a flat list.
@@ -72,19 +125,22 @@ class Widget(object):
                 grandchildren widgets.
         """
         result = []
-        for child in children:
-            if isinstance(child, dict):
-                continue
-            elif isinstance(child, Widget):
-                result.append(child.element)
-            elif type(child).__name__ == "generator":
-                result.extend(self._flatten(child))
-            elif isinstance(child, list):
-                result.extend(self._flatten(child))
-            elif isinstance(child, float):
-                result.append(str(child))
+        stack = [iter(children)]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, Widget):
+                    result.append(child.element)
+                elif isinstance(child, (GeneratorType, list)):
+                    stack.append(iter(child))
+                    break
+                elif isinstance(child, dict):
+                    continue
+                elif isinstance(child, float):
+                    result.append(str(child))
+                else:
+                    result.append(child)
             else:
-                result.append(child)
+                stack.pop()
         return result
 
     def css(self, property, value=None):
@@ -100,7 +156,7 @@ class Widget(object):
             value:Any The CSS value to set. Numeric values auto-convert to "px"
         """
         if isinstance(property, dict):
-            property = to_js(property)
+            property = _css_to_js(property)
         return self.element.css(property, value) if value != None else self.element.css(property)
 
     def attr(self, name, value=None):
@@ -326,7 +382,7 @@ class Widget(object):
             complete:function A Python function that is called when the animation is done.
         """
         if isinstance(properties, dict):
-            properties = to_js(properties)
+            properties = _css_to_js(properties)
         return self.element.animate(properties, duration, easing, proxy(complete))
 
     def __getattr__(self, name):
@@ -340,6 +396,20 @@ class Widget(object):
 
 
 
+def _forward_to_element(name):
+    def forward(self, *args, **kwargs):
+        return getattr(self.element, name)(*args, **kwargs)
+    return forward
+
+
+# Frequently used jQuery methods become real methods, so calling them does not fall through __getattr__
+for _name in (
+    "trigger", "hide", "show", "focus", "blur", "remove", "data", "offset",
+    "position", "draggable", "tabs", "eq", "each", "map",
+):
+    setattr(Widget, _name, _forward_to_element(_name))
+
+
 class HBox(Widget):
     """ Lays out its child widgets horizontally """
     classes = [ "ltk-hbox" ]
@@ -377,7 +447,14 @@ class Text(Widget):
     classes = [ "ltk-text" ]
 
     def __init__(self, *args, style=DEFAULT_CSS):
-        Widget.__init__(self, *args, style)
+        if len(args) == 1 and isinstance(args[0], str) and "<" not in args[0] and "&" not in args[0]:
+            # Fast path for plain text, which jQuery would not parse as HTML either
+            node = self._create_node()
+            node.textContent = args[0]
+            self.element = window.jQuery(node)
+            self._handle_css((style,))
+        else:
+            Widget.__init__(self, *args, style)
 
 
 class Input(Widget):
@@ -388,24 +465,24 @@ class Input(Widget):
     def __init__(self, value, style=DEFAULT_CSS):
         Widget.__init__(self, style)
         self.element.val(value)
-        self.on("wheel", ltk.proxy(lambda event: None)) # ensure Chrome handles wheel events
+        self.on("wheel", proxy(lambda event: None)) # ensure Chrome handles wheel events
 
 
 class Checkbox(Widget):
     """ Wraps an HTML element of type <input type="checkbox"> """
     classes = [ "ltk-checkbox" ]
     tag = "input"
+    input_type = "checkbox"
 
     def __init__(self, checked, style=DEFAULT_CSS):
         Widget.__init__(self, style)
-        self.element.prop("type", "checkbox")
         self.check(checked)
 
     def check(self, checked):
-        self.element.prop("checked", "checked" if checked else None)
+        self.element.prop("checked", bool(checked))
 
     def checked(self):
-        return self.element.prop("checked") == "checked"
+        return bool(self.element.prop("checked"))
 
 
 class Span(Widget):
@@ -427,22 +504,24 @@ class Switch(HBox):
             checked:bool Whether the switch is checked or not
         """
         def toggle_edit(event):
-            checked = self.element.find(".ltk-checkbox").prop("checked")
+            checked = self._checkbox.element.prop("checked")
             self.element.prop("checked", checked)
         id = f"edit-switch-{get_time()}"
+        self._checkbox = Checkbox(checked)
+        self._checkbox.attr("id", id).addClass("ltk-switch-checkbox").on("change", proxy(toggle_edit))
         HBox.__init__(self, 
             Div(label).addClass("ltk-switch-label"),
-            Checkbox(checked).attr("id", id).addClass("ltk-switch-checkbox").on("change", proxy(toggle_edit)),
+            self._checkbox,
             Label("").attr("value", "edit:").attr("for", id).addClass("ltk-switch"),
         )
 
         self.check(checked)
 
     def check(self, checked):
-        self.element.find(".ltk-checkbox").prop("checked", "checked" if checked else None)
+        self._checkbox.check(checked)
 
     def checked(self):
-        return self.element.find(".ltk-checkbox").prop("checked") == "checked"
+        return self._checkbox.checked()
 
 class Label(Widget):
     """ Wraps an HTML element of type <label> browser DOM element """
@@ -569,18 +648,27 @@ class Tabs(Widget):
         self.labels = UnorderedList()
         Widget.__init__(self, self.labels)
         self.attr("id", self.name)
-        for tab in self._flatten(tabs):
-            self.add_tab(tab)
+        labels = []
+        panels = []
+        for index, tab in enumerate(self._flatten(tabs)):
+            label, panel = self._create_tab(tab, index)
+            labels.append(label)
+            panels.append(panel)
+        self.labels.append(labels)
+        self.append(panels)
         self._handle_css(tabs)
         self.tabs()
         self.on("tabsactivate", proxy(lambda *args: self.find(".ltk-split-pane").trigger("layout")))
 
     def add_tab(self, tab):
-        tab_id = f"{self.name}-{self.labels.children().length}"
-        self.labels.append(
-            ListItem().append(Link(f"#{tab_id}").text(tab.attr("name")))
-        )
-        self.append(Div(tab).attr("id", tab_id))
+        label, panel = self._create_tab(tab, self.labels.children().length)
+        self.labels.append(label)
+        self.append(panel)
+
+    def _create_tab(self, tab, index):
+        tab_id = f"{self.name}-{index}"
+        label = ListItem().append(Link(f"#{tab_id}").text(tab.attr("name")))
+        return label, Div(tab).attr("id", tab_id)
 
     def active(self):
         return self.element.tabs("option", "active")
@@ -599,30 +687,30 @@ class File(Widget):
     """ Wraps an HTML element of type <input type=file> """
     classes = [ "ltk-file" ]
     tag = "input"
+    input_type = "file"
 
     def __init__(self, style=DEFAULT_CSS):
         Widget.__init__(self, style)
-        self.element.attr("type", "file")
 
 
 class DatePicker(Widget):
     """ Wraps an HTML element of type <input type=date> """
     classes = [ "ltk-datepicker" ]
     tag = "input"
+    input_type = "date"
 
     def __init__(self, style=DEFAULT_CSS):
         Widget.__init__(self, style)
-        self.element.attr("type", "date")
 
 
 class ColorPicker(Widget):
     """ Wraps an HTML element of type <input type=color> """
     classes = [ "ltk-colorpicker" ]
     tag = "input"
+    input_type = "color"
 
     def __init__(self, style=DEFAULT_CSS):
         Widget.__init__(self, style)
-        self.element.attr("type", "color")
 
 
 class RadioGroup(VBox):
@@ -640,10 +728,10 @@ class RadioButton(Widget):
     """ Wraps an HTML element of type <input type="radio"> """
     classes = [ "ltk-radiobutton" ]
     tag = "input"
+    input_type = "radio"
 
     def __init__(self, checked, style=DEFAULT_CSS):
         Widget.__init__(self, style)
-        self.element.prop("type", "radio")
         self.element.attr("checked", "checked" if checked else None)
 
 
@@ -652,12 +740,31 @@ class Table(Widget):
     classes = [ "ltk-table" ]
     tag = "table"
 
-    def __init__(self, *rows):
-        self.element = (
-            window.table()
-                .addClass(" ".join(self.classes))
-                .append(*self._flatten(rows))
-        )
+    @classmethod
+    def from_data(cls, rows):
+        """
+        Create a table from rows of plain values.
+
+        The rows and cells are created as raw DOM elements in a single document fragment,
+        rather than as widgets, which is much faster for large tables. The cells use the
+        same classes as the ones created by set, so get and set work on the result.
+
+        Args:
+            rows:list: A list of rows, each being a list of values shown as text
+        """
+        table = cls()
+        fragment = document.createDocumentFragment()
+        for row, values in enumerate(rows):
+            tr = document.createElement("tr")
+            tr.className = f"ltk-table-row ltk-row-{row}"
+            for column, value in enumerate(values):
+                td = document.createElement("td")
+                td.className = f"ltk-table-cell ltk-row-{row} ltk-col-{column}"
+                td.textContent = str(value)
+                tr.appendChild(td)
+            fragment.appendChild(tr)
+        table.element[0].appendChild(fragment)
+        return table
 
     def title(self, column, title):
         window.tableTitle(self.element, column, title)
@@ -687,8 +794,55 @@ class TableData(Text):
     tag = "td"
 
 
+class _FrameQueue():
+    """
+    Collects items and hands all of them to a handler in the next animation frame,
+    requesting at most one frame no matter how many items are added before it runs.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.items = []
+        self.requested = False
+        self.run_proxy = proxy(self.run)
+
+    def add(self, item):
+        """ Add an item to be handled in the next animation frame """
+        if item not in self.items:
+            self.items.append(item)
+        if not self.requested:
+            self.requested = True
+            window.requestAnimationFrame(self.run_proxy)
+
+    def run(self, _timestamp=None):
+        """ Handle all pending items, including ones added while handling them """
+        self.requested = False
+        while self.items:
+            items = list(self.items)
+            self.items.clear()
+            self.handler(items)
+
+
+def _run_layouts(panes):
+    """
+    Lay out all pending split panes in one animation frame. All sizes are read first,
+    then all sizes are written, and only then are nested panes notified. This avoids
+    interleaving DOM reads and writes, which would force a reflow for every pane.
+    """
+    sizes = [(pane, pane.get_size(pane), pane.get_size(pane.middle)) for pane in panes]
+    for pane, size, middle in sizes:
+        pane.apply_layout(size, middle)
+    for pane in panes:
+        pane.first.triggerHandler("layout")
+        pane.last.triggerHandler("layout")
+
+
+_layouts = _FrameQueue(_run_layouts)
+
+
 class SplitPane(Div):
     """ Lays out its child widgets horizontally or vertically with a resize handle in the center """
+    _ratio_cache = {}
 
     def resize(self):
         position = self.get_position(self.middle) - self.get_position(self)
@@ -696,21 +850,37 @@ class SplitPane(Div):
         self.layout()
 
     def restore(self):
-        try:
-            self.ratio = float(window.localStorage.getItem(self.key))
-        except:
-            self.ratio = 0.5
+        if self.key in SplitPane._ratio_cache:
+            self.ratio = SplitPane._ratio_cache[self.key]
+        else:
+            try:
+                self.ratio = float(window.localStorage.getItem(self.key))
+            except:
+                self.ratio = 0.5
+            SplitPane._ratio_cache[self.key] = self.ratio
         self.layout()
 
     def layout(self):
-        size = self.get_size(self)
-        middle = self.get_size(self.middle)
+        _layouts.add(self)
+
+    def handle_layout(self, event):
+        """ Lay out this pane when a "layout" event is triggered on it, without bubbling further """
+        event.stopPropagation()
+        if event.target.id == self.key:
+            self.layout()
+
+    def apply_layout(self, size, middle):
+        """ Write the sizes of both sides, using the pane and handle sizes read earlier in this frame """
         self.set_size(self.first, f"{self.ratio * size + middle}")
         self.set_size(self.last, f"{(1.0 - self.ratio) * size - middle}")
         self.set_position(self.middle, 0)
-        self.first.trigger("layout")
-        self.last.trigger("layout")
-        window.localStorage.setItem(self.key, f"{self.ratio}")
+        if SplitPane._ratio_cache.get(self.key) != self.ratio:
+            SplitPane._ratio_cache[self.key] = self.ratio
+            schedule(self.persist, f"persist-{self.key}", 0.2)
+
+    def persist(self):
+        """ Store the ratio in localStorage, so it is restored on the next page load """
+        window.localStorage.setItem(self.key, f"{SplitPane._ratio_cache[self.key]}")
 
     def __init__(self, first, last, key):
         """
@@ -736,7 +906,7 @@ class SplitPane(Div):
         self.addClass(f"ltk-split-pane")
         self.restore()
         self.layout()
-        self.on("layout", proxy(lambda event: self.layout() if event.target.id == self.key else None))
+        self.on("layout", proxy(self.handle_layout))
         schedule(self.layout, f"layout-{self.key}")
         window.addEventListener("resize", proxy(lambda *args: self.layout()))
 
@@ -799,6 +969,30 @@ class TextArea(Text):
         self.element.text(text)
 
 
+_hljs_languages = set()
+_hljs_pending = []
+
+
+def _inject_highlighter(language):
+    """Inject highlight.js the first time a Code widget needs it, and each language only once."""
+    if language in _hljs_languages or not _hljs_languages and hasattr(window, "hljs"):
+        return
+    if not _hljs_languages:
+        inject_css("https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/default.min.css")
+        inject_script("https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js")
+    _hljs_languages.add(language)
+    inject_script(f"https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/{language}.min.js")
+
+
+def _highlight_pending():
+    """Highlight all waiting Code widgets, polling with a single timer until highlight.js has loaded."""
+    if not hasattr(window, "hljs"):
+        schedule(_highlight_pending, "ltk-code-highlight", 0.1)
+        return
+    while _hljs_pending:
+        _hljs_pending.pop().highlight()
+
+
 class Code(Widget):
     """ Wraps an HTML element of type block of code """
     classes = [ "ltk-code" ]
@@ -807,22 +1001,21 @@ class Code(Widget):
 
     def __init__(self, language, code, style=DEFAULT_CSS):
         Widget.__init__(self, style)
-        if not hasattr(window, "hljs"):
-            inject_css("https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/default.min.css")
-            inject_script("https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js")
-            inject_script(f"https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/{language}.min.js")
-        self.element.text(code).css("opacity", 0)
-        schedule(self.highlight, f"{self}.highlight")
+        _inject_highlighter(language)
+        self.element.text(code)
+        _hljs_pending.append(self)
+        schedule(_highlight_pending, "ltk-code-highlight")
 
     def highlight(self):
         if self.highlighted:
             return
         if hasattr(window, "hljs"):
             window.hljs.highlightElement(self.element[0])
-            self.element.animate(to_js({ "opacity": 1}))
+            self.element.addClass("ltk-code-visible")
             self.highlighted = True
         else:
-            schedule(self.highlight, f"{self}.highlight", 0.1)
+            _hljs_pending.append(self)
+            schedule(_highlight_pending, "ltk-code-highlight", 0.1)
 
 
 class Image(Widget):
@@ -832,10 +1025,12 @@ class Image(Widget):
 
     def __init__(self, src, onerror=None, style=DEFAULT_CSS):
         Widget.__init__(self, style)
-        self.element.referrerPolicy = "referrer"
-        self.element.attr("src", src)
+        node = self.element[0]
+        node.referrerPolicy = "referrer"
         if onerror:
-            self.element.attr("onerror", f'this.src = "{onerror}"')
+            node.setAttribute("onerror", f'this.src = "{onerror}"')
+        if src is not None:
+            node.src = src # set last, so the referrer policy and error handler apply to the request
 
 
 class MenuBar(HBox):
@@ -876,22 +1071,44 @@ class Menu(Widget):
         return self
 
 
+_body_width = [None]
+
+
+def _get_body_width(refresh=False):
+    """
+    Return the width of the document body. It is read from the DOM again only after a window
+    resize, or when refresh is True. A body that changes width without a resize, for instance
+    when a scrollbar appears, is not noticed, so callers refresh before relying on an overflow.
+    """
+    if refresh or _body_width[0] is None:
+        _body_width[0] = _body.width()
+    return _body_width[0]
+
+
+def _invalidate_body_width(*_args):
+    _body_width[0] = None
+
+window.addEventListener("resize", proxy(_invalidate_body_width))
+
+
 class Popup(Widget):
     """ Wraps an HTML element of type div that is positioned on top of all other widgets """
     classes = [ "ltk-popup" ]
 
     def show(self, element):
         _close_all_menus()
-        (self
-            .appendTo(window.jQuery(window.document.body))
-            .css("top", element.offset().top + 28)
-            .css("left", min(element.offset().left + 2, window.jQuery(window.document.body).width() - self.width() - 12))
-        )
-        ltk.schedule(proxy(lambda: self.css("display", "block")), "ltk-menupopup")
+        offset = element.offset()
+        self.appendTo(_body).css("top", offset.top + 28)
+        left = offset.left + 2
+        right = self.width() + 12
+        if left + right > _get_body_width():
+            left = min(left, _get_body_width(refresh=True) - right)
+        self.css("left", left)
+        schedule(lambda: self.addClass("ltk-open"), "ltk-menupopup")
         return self
 
     def close(self):
-        self.css("display", "none")
+        self.removeClass("ltk-open")
 
 
 class MenuPopup(Popup):
@@ -946,10 +1163,13 @@ class Select(Widget):
         return self.element.prop("selectedIndex")
 
     def get_selected_option(self):
-        return self.element.find("option").eq(self.get_selected_index())
+        node = self.element[0]
+        return window.jQuery(node.options[node.selectedIndex])
 
     def changed(self):
-        self.handler(self.get_selected_index(), self.get_selected_option())
+        node = self.element[0]
+        index = node.selectedIndex
+        self.handler(index, window.jQuery(node.options[index]))
 
 
 class Form(Widget):
@@ -976,6 +1196,22 @@ class Option(Text):
     tag = "option"
 
 
+def _draw_arrow(steps):
+    """
+    Redraw the arrow of the most recently requested step, once per animation frame,
+    however many drag or mouseenter events asked for it since the previous frame.
+    """
+    step = steps[-1]
+    if not document.body.contains(step.element[0]):
+        return # the step was closed before this frame
+    find(".leader-line").remove()
+    target = step.widget.element if hasattr(step.widget, "element") else step.widget
+    window.addArrow(step.element, target)
+
+
+_arrows = _FrameQueue(_draw_arrow)
+
+
 class Step(Div):
     classes = [ "ltk-step" ]
 
@@ -984,33 +1220,37 @@ class Step(Div):
         self.content = content
         self.widget = widget
         self.draggable({
-            "drag": proxy(lambda *args: (
-                ltk.find(".leader-line").remove(),
-                schedule(self.show_arrow, "ltk-step-draw-arrow", 0.1)
-            )),
+            "drag": proxy(lambda *args: self.show_arrow()),
         })
 
         self.on("mouseenter", proxy(lambda event: self.show_arrow()))
 
+    def retarget(self, widget, content):
+        """
+        Point this step at another widget with new content, reusing its element and event handlers.
+        """
+        self.element.contents().slice(1).detach() # the first node holds the buttons
+        self.append(content)
+        self.content = content
+        self.widget = widget
+
     def show(self):
         if not getattr(self.widget, "is")(":visible"):
             return
-        ltk.find(".ltk-step").remove()
-        self.appendTo(ltk.find("body"))
-        self.css(ltk.to_js({
+        getattr(find(".ltk-step"), "not")(self.element).remove()
+        self.appendTo(_body)
+        offset = self.widget.offset()
+        self.css(to_js({
             "visibility": "visible",
             "opacity": 1,
-            "left": self.widget.offset().left + self.widget.outerWidth() + 100,
-            "top": self.widget.offset().top,
+            "left": offset.left + self.widget.outerWidth() + 100,
+            "top": offset.top,
             "width": "fit-content",
         }))
         self.show_arrow()
 
     def show_arrow(self):
-        ltk.find(".leader-line").remove()
-        source = self.element
-        target = self.widget.element if hasattr(self.widget, "element") else self.widget
-        ltk.schedule(proxy(lambda: ltk.window.addArrow(source, target)), "ltk-step-show-arrow")
+        _arrows.add(self)
 
     def hide(self):
         self.remove()
@@ -1022,14 +1262,22 @@ class Tutorial():
     def __init__(self, steps):
         self.steps = steps
         self.index = 0
-        self.steps = steps
+        self._buttons = HBox(
+            Text("⟸").on("click", proxy(lambda *args: self.previous())),
+            Text("⟹").on("click", proxy(lambda *args: self.next())),
+            Text("x").on("click", proxy(lambda *args: self.close())),
+        ).addClass("ltk-step-buttons")
+        self._widgets = {}
+        self._step = None
 
     def run(self):
         self.index = 0
         self.show()
         
     def close(self):
-        ltk.find(".leader-line, .ltk-step").remove()
+        find(".leader-line").remove()
+        if self._step:
+            self._step.element.detach() # keep the event handlers of the reused step
 
     def previous(self):
         self.close()
@@ -1051,20 +1299,23 @@ class Tutorial():
         if self.index < 0 or self.index >= len(self.steps):
             return
         selector, event, content = self.steps[self.index]
-        buttons = ltk.HBox(
-            ltk.Text("⟸").on("click", ltk.proxy(lambda *args: self.previous())),
-            ltk.Text("⟹").on("click", ltk.proxy(lambda *args: self.next())),
-            ltk.Text("x").on("click", ltk.proxy(lambda *args: self.close())),
-        ).addClass("ltk-step-buttons")
-        widget = ltk.find(selector)
-        Step(widget, buttons, content).show()
         index = self.index
-        widget.on(event, ltk.proxy(lambda *args: self.event(index)))
+        widget = self._widgets.get(index)
+        if widget is None or not widget.length or not document.body.contains(widget[0]):
+            # the target was never found, or it was detached or re-rendered since
+            widget = self._widgets[index] = find(selector)
+            widget.on(event, proxy(lambda *args: self.event(index)))
+        if self._step is None:
+            self._step = Step(widget, self._buttons, content)
+        else:
+            self._step.retarget(widget, content)
+        self._step.show()
 
 
 class Canvas(Widget):
     classes = [ "ltk-canvas" ]
     tag = "canvas"
+    _python_attributes = { "element", "stroke_style", "fill_style", "font" }
 
     def __init__(self, style=DEFAULT_CSS) -> None:
         self._context = None
@@ -1072,6 +1323,7 @@ class Canvas(Widget):
         self._fill_style = None
         self._stroke_style = None
         Widget.__init__(self, style)
+        self._context = self.element[0].getContext("2d")
 
     def __getattr__(self, name):
         try:
@@ -1083,9 +1335,12 @@ class Canvas(Widget):
                 raise AttributeError(f"LTK widget {self} does not have attribute {name}")
  
     def __setattr__(self, name, value):
-        if name != "_context" and self._context and hasattr(self._context, name):
+        if name[0] == "_" or name in Canvas._python_attributes:
+            # private state, the element, and the style properties never live on the JS objects
+            super().__setattr__(name, value)
+        elif self._context and hasattr(self._context, name):
             setattr(self._context, name, value)
-        elif name != "_context" and hasattr(self.element, name):
+        elif hasattr(self.element, name):
             setattr(self.element, name, value)
         else:
             super().__setattr__(name, value)
@@ -1104,7 +1359,7 @@ class Canvas(Widget):
     def stroke_style(self, value):
         if self._stroke_style != value:
             self._stroke_style = value
-            self.context.strokeStyle = value
+            self._context.strokeStyle = value
     
     @property
     def fill_style(self):
@@ -1114,7 +1369,7 @@ class Canvas(Widget):
     def fill_style(self, value):
         if self._fill_style != value:
             self._fill_style = value
-            self.context.fillStyle = value
+            self._context.fillStyle = value
     
     @property
     def font(self):
@@ -1124,44 +1379,46 @@ class Canvas(Widget):
     def font(self, value):
         if self._font != value:
             self._font = value
-            self.context.font = value
+            self._context.font = value
     
     def line(self, x1, y1, x2, y2):
-        window.canvas.line(self.context, x1, y1, x2, y2)
+        window.canvas.line(self._context, x1, y1, x2, y2)
 
     def text(self, x, y, text):
-        window.canvas.text(self.context, x, y, text)
+        window.canvas.text(self._context, x, y, text)
 
     def fill_text(self, x, y, text):
-        self.context.fillText(x, y, text)
+        self._context.fillText(x, y, text)
 
     def rect(self, x, y, w, h):
-        window.canvas.rect(self.context, x, y, w, h)
+        window.canvas.rect(self._context, x, y, w, h)
 
     def fill_rect(self, x, y, w, h):
-        self.context.fillRect(x, y, w, h)
+        self._context.fillRect(x, y, w, h)
 
     def circle(self, x, y, radius):
-        window.canvas.circle(self.context, x, y, radius)
+        window.canvas.circle(self._context, x, y, radius)
 
     def fill_circle(self, x, y, radius):
-        window.canvas.fillCircle(self.context, x, y, radius)
+        window.canvas.fillCircle(self._context, x, y, radius)
 
 
 def _close_all_menus(event=None):
-    if event and window.jQuery(event.target).hasClass("ltk-menulabel"):
+    if event and event.target.classList.contains("ltk-menulabel"):
         return
     find(".ltk-menupopup-open").removeClass("ltk-menupopup-open")
-    find(".ltk-menupopup, .ltk-popup").css("display", "none")
+    find(".ltk-open").removeClass("ltk-open")
 
-window.jQuery(window.document.body).on("click", proxy(_close_all_menus))
+_body.on("click", proxy(_close_all_menus))
 
 def _handle_shortcuts():
     def handle_keydown(event):
-        try:
-            shortcut = f"{'Cmd+' if event.metaKey else ''}{event.key.upper()}"
-        except:
-            shortcut = ""
+        if not shortcuts:
+            return
+        key = event.key
+        if not key:
+            return
+        shortcut = f"Cmd+{key.upper()}" if event.metaKey else key.upper()
         if shortcut in shortcuts:
             event.preventDefault()
             shortcuts[shortcut].select(event)
@@ -1170,9 +1427,7 @@ def _handle_shortcuts():
 
 _handle_shortcuts()
 
-import ltk
+def _handle_button_click(event):
+    return event.target.id
 
-ltk.find('.btn').on(
-    "click",
-    ltk.proxy(lambda event: ltk.find(event.target).attr("id"))
-)
\ No newline at end of file
+_body.on("click", ".btn", proxy(_handle_button_click))
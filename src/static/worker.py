@@ -24,7 +24,6 @@ import pyscript # type: ignore    pylint: disable=import-error
 get = ltk.window.get
 cache = {}
 results = {}
-inputs_cache = {}
 pysheets = api.PySheets(None, cache)
 completion_cache = {}
 
@@ -427,11 +426,8 @@ def handle_request(sender, topic, request): # pylint: disable=unused-argument
             generate_completion(data["key"], data["prompt"])
         elif topic == constants.TOPIC_WORKER_FIND_INPUTS:
             key, script = data["key"], data["script"]
-            inputs = inputs_cache.get(script, None)
             try:
-                if inputs is None:
-                    inputs = api.find_inputs(script)
-                inputs_cache[script] = inputs
+                inputs = api.find_inputs(script)
                 polyscript.xworker.sync.publish(
                     "Worker",
                     "Application",
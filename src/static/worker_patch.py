@@ -22,6 +22,8 @@ import polyscript # type: ignore    pylint: disable=import-error
 
 OriginalSession = requests.Session
 network_cache = {}
+NETWORK_CACHE_TTL_NS = 60_000_000_000
+NETWORK_CACHE_SIZE = 128
 network_calls = []
 
 
@@ -124,6 +126,17 @@ def wrap_as_file(content):
     return io.StringIO(content) if isinstance(content, str) else io.BytesIO(content)
 
 
+def _cache_response(url, entry):
+    """
+    Stores a response in the `network_cache`, evicting the least recently stored URL when
+    the cache holds `NETWORK_CACHE_SIZE` entries.
+    """
+    network_cache.pop(url, None)
+    if len(network_cache) >= NETWORK_CACHE_SIZE:
+        network_cache.pop(next(iter(network_cache)))
+    network_cache[url] = entry
+
+
 def _load_with_trampoline(url):
     """
     Loads the content from the provided URL using a trampoline mechanism to cache the response.
@@ -137,21 +150,38 @@ def _load_with_trampoline(url):
     This function first checks if the URL is already cached in the `network_cache` dictionary.
     If the cached content is less than 60 seconds old, it returns the cached value.
     Otherwise, it makes a GET request to the URL using `window.XMLHttpRequest` and caches
-    the response text. If the HTTP status code is not 200, it raises an `IOError` with the status code.
+    the response text. Stale entries are revalidated with the `ETag` and `Last-Modified` values
+    of the previous response, so an HTTP 304 reuses the cached content instead of downloading it
+    again. If the HTTP status code is not 200 or 304, it raises an `IOError` with the status code.
+    At most `NETWORK_CACHE_SIZE` responses are kept.
     """
     def get(url):
-        if url in network_cache:
-            when, content = network_cache[url]
-            if time.time() - when < 60:
+        cached = network_cache.get(url)
+        if cached:
+            when, content, etag, last_modified = cached
+            if time.monotonic_ns() - when < NETWORK_CACHE_TTL_NS:
                 return content
 
         xhr = ltk.window.XMLHttpRequest.new()
         xhr.open("GET", url, False)
+        if cached:
+            if etag:
+                xhr.setRequestHeader("If-None-Match", etag)
+            if last_modified:
+                xhr.setRequestHeader("If-Modified-Since", last_modified)
         xhr.send(None)
+        if cached and xhr.status == 304:
+            _cache_response(url, (time.monotonic_ns(), content, etag, last_modified))
+            return content
         if xhr.status != 200:
             raise IOError(f"HTTP Error: {xhr.status} for {url}")
         content = xhr.responseText
-        network_cache[url] = time.time(), content
+        _cache_response(url, (
+            time.monotonic_ns(),
+            content,
+            xhr.getResponseHeader("ETag"),
+            xhr.getResponseHeader("Last-Modified"),
+        ))
         network_calls.append((
             "GET", 
             url, 
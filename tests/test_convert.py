@@ -42,3 +42,33 @@ class TestConvert(unittest.TestCase):
         Tests that the `convert` function correctly converts an empty string to 0.
         """
         self.assertEqual(api.convert(""), 0)
+
+    def test_convert_signed(self):
+        """
+        Tests that the `convert` function correctly converts signed numbers.
+        """
+        self.assertEqual(api.convert("-5"), -5)
+        self.assertEqual(api.convert("+.5"), 0.5)
+
+    def test_convert_not_a_number(self):
+        """
+        Tests that the `convert` function leaves strings that only look like numbers alone.
+        """
+        self.assertEqual(api.convert("1.2.3"), "1.2.3")
+        self.assertEqual(api.convert("."), ".")
+        self.assertEqual(api.convert("-"), "-")
+        self.assertEqual(api.convert("12a"), "12a")
+
+    def test_convert_exponent(self):
+        """
+        Tests that the `convert` function converts floats written with an exponent.
+        """
+        self.assertEqual(api.convert("1.5e3"), 1500.0)
+        self.assertEqual(api.convert("1.5E-3"), 0.0015)
+
+    def test_convert_underscore(self):
+        """
+        Tests that the `convert` function converts numbers that use underscores or non-ASCII digits.
+        """
+        self.assertEqual(api.convert("1_000"), 1000)
+        self.assertEqual(api.convert("١٢"), 12)
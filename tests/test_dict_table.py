@@ -0,0 +1,47 @@
+"""
+CopyRight (c) 2024 - Chris Laffra - All Rights Reserved.
+
+Tests the `get_dict_table` function from the `api` module, which renders a dict as an HTML table.
+"""
+
+import sys
+import unittest
+
+sys.path.append("..")
+
+from tests import mocks # pylint: disable=wrong-import-position,unused-import
+from static import api # pylint: disable=wrong-import-position
+
+
+class TestDictTable(unittest.TestCase):
+    """
+    Tests the `get_dict_table` function from the `api` module, which renders a dict as an HTML table.
+    """
+
+    def test_not_a_dict(self):
+        """
+        Tests that `get_dict_table` rejects values that are not a dict.
+        """
+        with self.assertRaises(ValueError):
+            api.get_dict_table([1, 2])
+
+    def test_flat_dict(self):
+        """
+        Tests that `get_dict_table` renders non-dict values using their repr.
+        """
+        actual = api.get_dict_table({"a": 1, "b": "x"})
+        self.assertEqual(actual, "".join([
+            "<table border='1' class='dict_table'><thead><tr><th>key</th><th>value</th></tr></thead><tbody>",
+            "<tr><td>a</td><td>1</td></tr>",
+            "<tr><td>b</td><td>'x'</td></tr>",
+            "</tbody></table>",
+        ]))
+
+    def test_nested_dict(self):
+        """
+        Tests that `get_dict_table` renders nested dicts as nested tables.
+        """
+        actual = api.get_dict_table({"a": {"b": 2}})
+        self.assertEqual(actual.count("<table"), 2)
+        self.assertEqual(actual.count("</tbody></table>"), 2)
+        self.assertIn("<tr><td>b</td><td>2</td></tr>", actual)
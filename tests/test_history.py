@@ -18,6 +18,9 @@ from static import history # pylint: disable=wrong-import-position,unused-import
 from static import state # pylint: disable=wrong-import-position,unused-import
 from static import timeline # pylint: disable=wrong-import-position,unused-import
 
+flush = history.flush
+
+
 class TestHistoryAdd(unittest.TestCase):
     """
     This class contains unit tests for the `history.add()` function, which is used to add edits to the undo-history.
@@ -142,3 +145,15 @@ class TestHistoryAdd(unittest.TestCase):
         edit = models.CellValueChanged("A1", "old", "new")
         history.add(edit)
         mock_schedule_flush.assert_called_once()
+
+    @unittest.mock.patch('static.history.ltk.cancel')
+    @unittest.mock.patch('static.history.storage.save')
+    def test_flush_cancels_scheduled_flush(self, mock_save, mock_cancel):
+        """
+        Verifies that an explicit flush cancels a pending scheduled flush, so the sheet is saved once.
+        """
+        history.flush_scheduled = True
+        flush()
+        mock_save.assert_called_once()
+        mock_cancel.assert_called_once_with("flush events")
+        self.assertFalse(history.flush_scheduled)
@@ -48,6 +48,19 @@ class TestInputs(unittest.TestCase):
         """
         self.check("x = C2", ["C2"])
 
+    def test_name_without_row(self):
+        """
+        Uppercase names without a row number are not cell references.
+        """
+        self.check("X + AB + C2", ["C2"])
+
+    def test_separate_scripts(self):
+        """
+        Inputs found in one script do not leak into the inputs of another script.
+        """
+        self.check("A1 + B1", ["A1", "B1"])
+        self.check("C1", ["C1"])
+
     def test_syntax_error(self):
         """
         Syntactically incorrect scripts have no inputs.
@@ -46,3 +46,36 @@ class TestKeys(unittest.TestCase):
         self.assertEqual(api.get_column_name(2), "B")
         self.assertEqual(api.get_column_name(27), "AA")
         self.assertEqual(api.get_column_name(28), "AB")
+
+    def test_sheets_get_key(self):
+        """
+        Tests `PySheets.get_key`, which should compute keys in Python, matching `get_key_from_col_row`.
+        """
+        sheets = api.PySheets(None, {})
+        self.assertEqual(sheets.get_key(1, 1), "A1")
+        self.assertEqual(sheets.get_key(28, 3), "AB3")
+        self.assertEqual(sheets.get_key(2000, 7), api.get_key_from_col_row(2000, 7))
+
+    def test_is_cell_reference(self):
+        """
+        Tests `is_cell_reference`, which accepts letters followed by digits, as well as empty
+        and letter-only strings.
+        """
+        self.assertTrue(api.is_cell_reference("A1"))
+        self.assertTrue(api.is_cell_reference("BC45"))
+        self.assertTrue(api.is_cell_reference("X"))
+        self.assertTrue(api.is_cell_reference(""))
+        self.assertFalse(api.is_cell_reference("a1"))
+        self.assertFalse(api.is_cell_reference("1A"))
+
+    def test_is_cell_range_reference(self):
+        """
+        Tests `is_cell_range_reference`, which matches the `cell_range_reference` pattern.
+        """
+        for text in ["A1:B2", "BC45 : DE67", "A1:B2\n", "A1:B", "A:B2", "A1:B2:C3", "A1\t:B2", "A1:B2\n\n", ":", ""]:
+            self.assertEqual(
+                bool(api.is_cell_range_reference(text)),
+                bool(api.cell_range_reference.match(text)),
+                text
+            )
+        self.assertFalse(api.is_cell_range_reference(None))